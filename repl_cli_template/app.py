@@ -7,15 +7,13 @@ import logging
 import sys
 from pathlib import Path
 
-from click_repl import repl
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.styles import Style
-from rich.console import Console
+from rich.console import Group
+from rich.text import Text
 
 from repl_cli_template.core.config_manager import ConfigManager
 from repl_cli_template.core.logging_setup import setup_logging
+from repl_cli_template.ui.console import console
 from repl_cli_template.ui.welcome import show_welcome
-from repl_cli_template.ui.styles import APP_THEME
 from repl_cli_template.commands.system_commands import (
     help_command,
     quit_command,
@@ -24,9 +22,6 @@ from repl_cli_template.commands.system_commands import (
 from repl_cli_template.commands.config_commands import config
 from repl_cli_template.commands.process_commands import process
 
-# Initialize console
-console = Console(theme=APP_THEME)
-
 # Application metadata
 APP_NAME = "REPL CLI Template"
 APP_VERSION = "1.0.0"
@@ -36,6 +31,18 @@ DEFAULT_CONFIG = "config.yaml"
 COMPLETION_MENU_HEIGHT = 8  # Number of lines reserved for completion menu
 CONSOLE_LOG_LEVEL = logging.WARNING  # Log level for console in CLI mode
 
+# Pre-rendered markup for the per-command REPL paths, so Rich parses each
+# template once at import instead of on every command/error
+ERROR_PREFIX = Text.from_markup("[red]Error:[/red]")
+UNKNOWN_PREFIX = Text.from_markup("[red]Unknown command:[/red]")
+EXAMPLE_PREFIX = Text.from_markup("[dim]Example:[/dim]")
+USAGE_PREFIX = Text.from_markup("[dim]For full usage:[/dim]")
+AGENT_PREFIX = Text.from_markup("[yellow]Agent mode:[/yellow] Would send to LLM:")
+AGENT_NOT_IMPLEMENTED = Text.from_markup("[dim](Agent integration not yet implemented)[/dim]")
+SLASH_HINT = Text.from_markup("[dim]Commands must start with /[/dim]")
+TRY_HELP_HINT = Text.from_markup("[dim]Try:[/dim] [cyan]/help[/cyan] to see available commands")
+AGENT_TIP = Text.from_markup("[dim]Tip: Enable agent mode in config to send free text to LLM[/dim]")
+
 
 @click.group(invoke_without_command=True)
 @click.option("--config", "-c", default=DEFAULT_CONFIG, help="Path to config file")
@@ -57,8 +64,8 @@ def cli(context, config, repl_mode):
     # Load configuration
     try:
         if Path(config).exists():
+            # load returns the config already merged with defaults
             config_dict = ConfigManager.load(config)
-            config_dict = ConfigManager.merge_with_defaults(config_dict)
         else:
             # Use defaults if config file doesn't exist
             config_dict = ConfigManager.get_defaults()
@@ -114,6 +121,13 @@ def start_repl(context: click.Context) -> None:
         EOFError: When user presses Ctrl+D
         ExitReplException: When user runs /quit or /exit
     """
+    # REPL-only dependencies are imported here so plain CLI invocations
+    # (e.g. `process`, `config show`) don't pay their import cost
+    from click_repl import repl, ExitReplException
+    from prompt_toolkit.styles import Style
+
+    from repl_cli_template.ui.history import BoundedFileHistory
+
     # Show welcome screen
     config_dict = context.obj["config"]
     config_file = context.obj["config_file"]
@@ -124,10 +138,11 @@ def start_repl(context: click.Context) -> None:
 
     show_welcome(console, app_name, app_version, config_file, log_file)
 
-    # Build command dictionary with help text
+    # Build command dictionary with help text, sorted once here so the
+    # completer can rely on insertion order instead of re-sorting
     commands_dict = {}
     if hasattr(context.command, "commands"):
-        for name, cmd in context.command.commands.items():
+        for name, cmd in sorted(context.command.commands.items()):
             commands_dict[name] = cmd.help or "No description"
 
     # Create custom completer with Click CLI group for subcommand support
@@ -161,10 +176,13 @@ def start_repl(context: click.Context) -> None:
     # Custom prompt - just "> " with separator handled separately
     prompt_kwargs = {
         "message": "> ",  # Simple prompt
-        "history": FileHistory(".repl_history"),
+        "history": BoundedFileHistory(".repl_history"),
         "completer": completer,
         "complete_while_typing": True,  # Show completions as you type (standard behavior)
-        "complete_in_thread": False,  # Sync completion for faster response
+        # Run the completer off the UI thread so keystroke echo never blocks
+        # on completion work; safe because the completer's index is built
+        # once in __init__ and never mutated afterwards
+        "complete_in_thread": True,
         "style": completion_style,
         "key_bindings": kb,  # Empty key bindings - use defaults
         "complete_style": "COLUMN",  # Single column - one command per line
@@ -173,7 +191,6 @@ def start_repl(context: click.Context) -> None:
 
     # Patch click_repl to strip leading / from commands and add separators
     import click_repl._repl as repl_module
-    from click_repl import ExitReplException
 
     # Defensive check: verify the function we're patching exists
     if not hasattr(repl_module, "_execute_internal_and_sys_cmds"):
@@ -185,6 +202,40 @@ def start_repl(context: click.Context) -> None:
     # Save original function
     original_execute = repl_module._execute_internal_and_sys_cmds
 
+    # Read agent.enabled once instead of on every command; /config set
+    # updates the ref through the callback registered below
+    agent_enabled_ref = [ConfigManager.get(config_dict, "agent.enabled", False)]
+
+    def _on_config_set(key: str, value) -> None:
+        """Keep the hoisted agent.enabled flag in sync with /config set."""
+        if key == "agent.enabled":
+            agent_enabled_ref[0] = value
+
+    context.obj.setdefault("config_set_callbacks", []).append(_on_config_set)
+
+    # Known top-level commands, so unknown input is rejected with a set
+    # membership test instead of a raised-and-string-matched exception
+    known_commands = frozenset(getattr(context.command, "commands", {}))
+
+    def print_unknown_command(command: str) -> None:
+        """
+        Render the unknown-command help block.
+
+        Args:
+            command: The command string that was not recognized
+        """
+        lines = [
+            Text(),
+            Text.assemble(UNKNOWN_PREFIX, " ", command),
+            Text(),
+            SLASH_HINT,
+            TRY_HELP_HINT,
+        ]
+        if not agent_enabled_ref[0]:
+            lines.append(AGENT_TIP)
+        lines.append(Text())
+        console.print(Group(*lines))
+
     def execute_with_slash_stripping(
         command: str, allow_internal_commands: bool, allow_system_commands: bool
     ) -> None:
@@ -199,8 +250,8 @@ def start_repl(context: click.Context) -> None:
             allow_internal_commands: Whether to allow internal commands
             allow_system_commands: Whether to allow system commands
         """
-        # Check if agent mode is enabled
-        agent_enabled = ConfigManager.get(config_dict, "agent.enabled", False)
+        # Check if agent mode is enabled (hoisted out of the per-command path)
+        agent_enabled = agent_enabled_ref[0]
 
         # Strip leading / if present (Claude Code style)
         if command.startswith("/"):
@@ -209,12 +260,26 @@ def start_repl(context: click.Context) -> None:
             # No / prefix - could be free text for agent
             if agent_enabled and command.strip():
                 # Future: Send to agent/LLM
-                console.print()
+                # One print per block keeps render/flush overhead off the
+                # per-command path
                 console.print(
-                    "[yellow]Agent mode:[/yellow] Would send to LLM: " + command
+                    Group(
+                        Text(),
+                        Text.assemble(AGENT_PREFIX, " ", command),
+                        AGENT_NOT_IMPLEMENTED,
+                        Text(),
+                    )
                 )
-                console.print("[dim](Agent integration not yet implemented)[/dim]")
-                console.print()
+                return None
+
+        # Reject unknown commands with a set lookup before dispatch, so the
+        # common typo case never pays for a raised-and-caught exception.
+        # Internal (:) and system (!) commands are click_repl's to handle.
+        stripped = command.strip()
+        if stripped and not stripped.startswith((":", "!")):
+            first_word = stripped.split(None, 1)[0]
+            if first_word not in known_commands:
+                print_unknown_command(command)
                 return None
 
         # Try to execute the command
@@ -228,9 +293,8 @@ def start_repl(context: click.Context) -> None:
 
         except click.exceptions.ClickException as e:
             # Handle Click exceptions (missing args, bad options, etc.) gracefully
-            console.print()
             error_message = e.format_message()
-            console.print(f"[red]Error:[/red] {error_message}")
+            lines = [Text(), Text.assemble(ERROR_PREFIX, " ", error_message)]
 
             # Extract option names from error message if it's a missing option error
             if "Missing option" in error_message:
@@ -240,43 +304,40 @@ def start_repl(context: click.Context) -> None:
                 option_match = re.search(r"'([^']+)'", error_message)
                 if option_match:
                     option_name = option_match.group(1)
-                    console.print()
-                    console.print(
-                        f"[dim]Example:[/dim] [cyan]/{command} {option_name} <value>[/cyan]"
+                    lines.append(Text())
+                    lines.append(
+                        Text.assemble(
+                            EXAMPLE_PREFIX,
+                            " ",
+                            Text(f"/{command} {option_name} <value>", style="cyan"),
+                        )
                     )
 
-            console.print()
-            console.print(
-                f"[dim]For full usage:[/dim] [cyan]/{command.split()[0]} --help[/cyan]"
+            lines.append(Text())
+            lines.append(
+                Text.assemble(
+                    USAGE_PREFIX, " ", Text(f"/{command.split()[0]} --help", style="cyan")
+                )
             )
-            console.print()
+            lines.append(Text())
+            console.print(Group(*lines))
             return None
 
         except Exception as e:
-            # Handle unknown command errors gracefully
+            # Handle unknown command errors gracefully (defensive fallback -
+            # the membership check above catches the common case)
             error_msg = str(e)
             if (
                 "No such command" in error_msg
                 or "no command named" in error_msg.lower()
             ):
-                console.print()
-                console.print(f"[red]Unknown command:[/red] {command}")
-                console.print()
-                console.print("[dim]Commands must start with /[/dim]")
-                console.print(
-                    "[dim]Try:[/dim] [cyan]/help[/cyan] to see available commands"
-                )
-                if not agent_enabled:
-                    console.print(
-                        "[dim]Tip: Enable agent mode in config to send free text to LLM[/dim]"
-                    )
-                console.print()
+                print_unknown_command(command)
                 return None
             else:
                 # For other exceptions, show simplified error
-                console.print()
-                console.print(f"[red]Error:[/red] {str(e)}")
-                console.print()
+                console.print(
+                    Group(Text(), Text.assemble(ERROR_PREFIX, " ", str(e)), Text())
+                )
                 return None
 
     # Temporarily replace the function
@@ -6,13 +6,20 @@ import click
 import logging
 import yaml
 
-from rich.console import Console
+# Prefer the C-accelerated libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.syntax import Syntax
+from rich.text import Text
 
 from repl_cli_template.core.config_manager import ConfigManager
+from repl_cli_template.ui.console import console as shared_console
 from repl_cli_template.ui.styles import (
-    APP_THEME,
     format_success,
     format_error,
     format_info,
@@ -29,9 +36,9 @@ def _get_console(context: click.Context) -> Console:
         context: Click context object
 
     Returns:
-        Console instance from context, or new instance if not found
+        Console instance from context, or the shared console if not found
     """
-    return context.obj.get("console", Console(theme=APP_THEME))
+    return context.obj.get("console", shared_console)
 
 
 @click.group()
@@ -53,8 +60,13 @@ def config_show(context):
             console.print(format_info("No configuration loaded"))
             return
 
+        # Hide sentinel keys (e.g. the flattened lookup view) from display
+        config_dict = {k: v for k, v in config_dict.items() if not k.startswith("__")}
+
         # Convert config to YAML for pretty display
-        config_yaml = yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+        config_yaml = yaml.dump(
+            config_dict, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+        )
 
         # Syntax highlighting
         syntax = Syntax(config_yaml, "yaml", theme="monokai", line_numbers=False)
@@ -67,9 +79,8 @@ def config_show(context):
             padding=(1, 2),
         )
 
-        console.print()
-        console.print(panel)
-        console.print()
+        # Single print per block keeps render/flush overhead down
+        console.print(Group(Text(), panel, Text()))
 
     except Exception as e:
         console.print(format_error(str(e)))
@@ -85,19 +96,14 @@ def config_load(context, file):
     console = _get_console(context)
 
     try:
-        # Load config
+        # Load config (already merged with defaults)
         config_dict = ConfigManager.load(file)
 
-        # Merge with defaults
-        config_dict = ConfigManager.merge_with_defaults(config_dict)
-
         # Update context
         context.obj["config"] = config_dict
         context.obj["config_file"] = file
 
-        console.print()
-        console.print(format_success(f"Configuration loaded from: {file}"))
-        console.print()
+        console.print(f"\n{format_success(f'Configuration loaded from: {file}')}\n")
 
     except FileNotFoundError:
         error_msg = f"Config file not found: {file}"
@@ -135,9 +141,7 @@ def config_save(context, file):
         # Save config
         ConfigManager.save(config_dict, file)
 
-        console.print()
-        console.print(format_success(f"Configuration saved to: {file}"))
-        console.print()
+        console.print(f"\n{format_success(f'Configuration saved to: {file}')}\n")
 
     except Exception as e:
         console.print(format_error(f"Failed to save config: {str(e)}"))
@@ -165,9 +169,11 @@ def config_set(context, key, value):
         # Set the value
         ConfigManager.set(config_dict, key, value)
 
-        console.print()
-        console.print(format_success(f"Set {key} = {value}"))
-        console.print()
+        # Notify listeners (e.g. the REPL's hoisted agent.enabled flag)
+        for callback in context.obj.get("config_set_callbacks", []):
+            callback(key, value)
+
+        console.print(f"\n{format_success(f'Set {key} = {value}')}\n")
 
     except Exception as e:
         console.print(format_error(f"Failed to set config: {str(e)}"))
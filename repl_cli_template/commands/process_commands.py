@@ -8,8 +8,10 @@ import logging
 from rich.console import Console
 from rich.table import Table
 
+from repl_cli_template.core.config_manager import ConfigManager
 from repl_cli_template.core.processor import process_data
-from repl_cli_template.ui.styles import APP_THEME, format_success, format_error
+from repl_cli_template.ui.console import console as shared_console
+from repl_cli_template.ui.styles import format_success, format_error
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +24,9 @@ def _get_console(context: click.Context) -> Console:
         context: Click context object
 
     Returns:
-        Console instance from context, or new instance if not found
+        Console instance from context, or the shared console if not found
     """
-    return context.obj.get("console", Console(theme=APP_THEME))
+    return context.obj.get("console", shared_console)
 
 
 @click.command()
@@ -39,11 +41,10 @@ def process(context, input_file, output):
         # Get config from context
         config = context.obj.get("config", {})
 
-        # Override output path if specified (CLI arg overrides config)
+        # Override output path if specified (CLI arg overrides config).
+        # Go through ConfigManager.set so cached lookup views stay coherent.
         if output:
-            if "paths" not in config:
-                config["paths"] = {}
-            config["paths"]["output_dir"] = output
+            ConfigManager.set(config, "paths.output_dir", output)
 
         # Call core business logic (handles file validation, etc.)
         result = process_data(input_file, config)
@@ -5,7 +5,8 @@ System commands: help, quit, reload, etc.
 import click
 from rich.console import Console
 from rich.table import Table
-from repl_cli_template.ui.styles import APP_THEME, format_info
+from repl_cli_template.ui.console import console as shared_console
+from repl_cli_template.ui.styles import format_info
 from repl_cli_template.ui.welcome import show_goodbye
 
 
@@ -17,9 +18,9 @@ def _get_console(context: click.Context) -> Console:
         context: Click context object
 
     Returns:
-        Console instance from context, or new instance if not found
+        Console instance from context, or the shared console if not found
     """
-    return context.obj.get("console", Console(theme=APP_THEME))
+    return context.obj.get("console", shared_console)
 
 
 @click.command()
@@ -3,13 +3,35 @@ Configuration management module.
 Handles loading, saving, and accessing configuration values.
 """
 
+import os
+import pickle
+import tempfile
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Prefer the C-accelerated libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 logger = logging.getLogger(__name__)
 
+# Suffix for the pickled sidecar cache written next to each YAML config file
+CACHE_SUFFIX = ".cache.pkl"
+
+# Version tag stored in the sidecar cache; bump whenever get_defaults()
+# changes so cached post-merge configs are rebuilt
+CACHE_SCHEMA_VERSION = 2
+
+# Sentinel key under which the flattened lookup view is cached on a config dict
+FLAT_KEY = "__flat__"
+
+# Sentinel distinguishing "key absent" from a stored None value
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages configuration loading, saving, and access."""
@@ -19,11 +41,18 @@ class ConfigManager:
         """
         Load configuration from YAML file with validation.
 
+        The returned config is already merged with defaults. Merged configs
+        are cached in a pickled sidecar file next to the YAML file (keyed by
+        mtime, size, and a schema version), so unchanged configs skip both
+        YAML parsing and the defaults merge on subsequent loads. The cache is
+        best-effort: any failure to read or write it falls back to parsing
+        the YAML file directly.
+
         Args:
             path: Path to config file
 
         Returns:
-            Dictionary containing configuration
+            Dictionary containing configuration merged with defaults
 
         Raises:
             FileNotFoundError: If config file doesn't exist
@@ -36,9 +65,17 @@ class ConfigManager:
             logger.error(f"Config file not found: {path}")
             raise FileNotFoundError(f"Config file not found: {path}")
 
+        file_stat = config_path.stat()
+        cache_path = Path(str(config_path) + CACHE_SUFFIX)
+
+        cached = ConfigManager._read_cache(cache_path, file_stat)
+        if cached is not None:
+            logger.info(f"Config loaded from cache: {cache_path}")
+            return cached
+
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
 
             if config is None:
                 config = {}
@@ -49,6 +86,11 @@ class ConfigManager:
                     f"Config must be a dictionary, got {type(config).__name__}"
                 )
 
+            # Merge before caching so cache hits skip the merge entirely
+            config = ConfigManager.merge_with_defaults(config)
+
+            ConfigManager._write_cache(cache_path, file_stat, config)
+
             logger.info(f"Config loaded from: {path}")
             return config
 
@@ -56,6 +98,69 @@ class ConfigManager:
             logger.exception(f"Invalid YAML in config file: {path}")
             raise ValueError(f"Invalid YAML in config file: {path}") from e
 
+    @staticmethod
+    def _read_cache(cache_path: Path, file_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Read the pickled sidecar cache if it matches the source file.
+
+        Args:
+            cache_path: Path to the sidecar cache file
+            file_stat: Stat result of the source YAML file
+
+        Returns:
+            Cached config dictionary, or None if missing, stale, or unreadable
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                schema_version, mtime_ns, size, config = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+            return None
+
+        if (
+            schema_version != CACHE_SCHEMA_VERSION
+            or mtime_ns != file_stat.st_mtime_ns
+            or size != file_stat.st_size
+        ):
+            return None
+
+        if not isinstance(config, dict):
+            return None
+
+        return config
+
+    @staticmethod
+    def _write_cache(cache_path: Path, file_stat: os.stat_result, config: Dict[str, Any]) -> None:
+        """
+        Atomically write the pickled sidecar cache for a parsed config.
+
+        Failures (e.g. read-only directory) are logged and ignored so the
+        cache never breaks config loading.
+
+        Args:
+            cache_path: Path to the sidecar cache file
+            file_stat: Stat result of the source YAML file
+            config: Merged configuration dictionary to cache
+        """
+        # Don't persist sentinel keys like the flattened lookup view
+        config = {k: v for k, v in config.items() if not k.startswith("__")}
+
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (CACHE_SCHEMA_VERSION, file_stat.st_mtime_ns, file_stat.st_size, config),
+                        f,
+                    )
+                os.replace(temp_path, cache_path)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            logger.debug(f"Could not write config cache: {cache_path}")
+
     @staticmethod
     def save(config: Dict[str, Any], path: str) -> None:
         """
@@ -68,9 +173,14 @@ class ConfigManager:
         config_path = Path(path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Don't persist sentinel keys like the flattened lookup view
+        config = {k: v for k, v in config.items() if not k.startswith("__")}
+
         try:
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+                )
 
             logger.info(f"Config saved to: {path}")
 
@@ -91,11 +201,29 @@ class ConfigManager:
         Returns:
             Configuration value or default
 
+        Note:
+            A flattened lookup view is cached on the dict itself; mutate
+            configs through ConfigManager.set (not directly) so lookups
+            stay in sync.
+
         Example:
             >>> config = {'logging': {'level': 'INFO'}}
             >>> ConfigManager.get(config, 'logging.level')
             'INFO'
         """
+        # Fast path: flattened view cached on the dict (built on first get,
+        # invalidated by set), so repeated lookups are a single dict hit
+        if isinstance(config, dict):
+            flat = config.get(FLAT_KEY)
+            if flat is None:
+                flat = ConfigManager.flatten(config)
+                config[FLAT_KEY] = flat
+
+            value = flat.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        # Fallback traversal covers non-leaf keys (e.g. 'logging')
         keys = key.split(".")
         value = config
 
@@ -106,6 +234,35 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
 
+    @staticmethod
+    def flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """
+        Flatten a nested config into dot-notation keys.
+
+        Sentinel keys (double-underscore prefixed) are skipped.
+
+        Args:
+            config: Configuration dictionary
+            prefix: Key prefix used during recursion
+
+        Returns:
+            Flat dictionary mapping 'a.b.c' paths to leaf values
+
+        Example:
+            >>> ConfigManager.flatten({'logging': {'level': 'INFO'}})
+            {'logging.level': 'INFO'}
+        """
+        flat: Dict[str, Any] = {}
+        for key, value in config.items():
+            if key.startswith("__"):
+                continue
+            path = f"{prefix}{key}"
+            if isinstance(value, dict) and value:
+                flat.update(ConfigManager.flatten(value, prefix=f"{path}."))
+            else:
+                flat[path] = value
+        return flat
+
     @staticmethod
     def set(config: Dict[str, Any], key: str, value: Any) -> None:
         """
@@ -141,6 +298,10 @@ class ConfigManager:
 
         # Set the final key
         current[keys[-1]] = value
+
+        # Invalidate the flattened lookup view; get rebuilds it on demand
+        config.pop(FLAT_KEY, None)
+
         logger.debug(f"Config updated: {key} = {value}")
 
     @staticmethod
@@ -159,6 +320,10 @@ class ConfigManager:
                 "console_enabled": False,
             },
             "paths": {"input_dir": "data/input", "output_dir": "data/output"},
+            "processing": {
+                "unicode": False,  # Per-line str.upper() for non-ASCII inputs
+                "workers": None,  # Worker processes for large files (None = all cores)
+            },
             "agent": {
                 "enabled": False,  # EXPERIMENTAL: Agent mode not fully implemented
                 "model": "gpt-4",
@@ -183,6 +348,9 @@ class ConfigManager:
         """
         defaults = ConfigManager.get_defaults()
 
+        # Don't carry sentinel keys (stale flattened views) into the merge
+        config = {k: v for k, v in config.items() if not k.startswith("__")}
+
         def deep_merge(base: Dict, override: Dict) -> Dict:
             """Recursively merge two dictionaries."""
             result = base.copy()
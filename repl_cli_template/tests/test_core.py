@@ -36,6 +36,82 @@ class TestProcessor:
         assert "HELLO" in output_content
         assert "WORLD" in output_content
 
+    def test_process_data_counts_unterminated_last_line(self, tmp_path):
+        """Test that a final line without a newline is still counted."""
+        input_file = tmp_path / "test_input.txt"
+        input_file.write_text("one\ntwo\nthree")
+
+        config = {"paths": {"output_dir": str(tmp_path / "output")}}
+
+        result = process_data(str(input_file), config)
+
+        assert result["rows"] == 3
+
+    def test_process_data_unicode_mode(self, tmp_path):
+        """Test that processing.unicode enables non-ASCII uppercasing."""
+        input_file = tmp_path / "test_input.txt"
+        input_file.write_text("café\n", encoding="utf-8")
+
+        config = {
+            "paths": {"output_dir": str(tmp_path / "output")},
+            "processing": {"unicode": True},
+        }
+
+        result = process_data(str(input_file), config)
+
+        assert result["rows"] == 1
+        output_content = Path(result["output"]).read_text(encoding="utf-8")
+        assert "CAFÉ" in output_content
+
+    def test_process_data_coerces_string_workers(self, tmp_path):
+        """Test that a string processing.workers (from config set) doesn't crash."""
+        input_file = tmp_path / "test_input.txt"
+        input_file.write_text("hello\nworld\n")
+
+        config = {
+            "paths": {"output_dir": str(tmp_path / "output")},
+            "processing": {"workers": "4"},
+        }
+
+        result = process_data(str(input_file), config)
+
+        assert result["status"] == "success"
+        assert result["rows"] == 2
+
+    def test_newline_boundaries_align_on_newlines(self, tmp_path):
+        """Test that chunk boundaries land just after newlines."""
+        from repl_cli_template.core.processor import _newline_boundaries
+
+        input_file = tmp_path / "test_input.txt"
+        input_file.write_text("aaaa\nbbbb\ncccc\ndddd\n")
+        file_size = input_file.stat().st_size
+
+        boundaries = _newline_boundaries(input_file, file_size, workers=2)
+
+        assert boundaries[0] == 0
+        assert boundaries[-1] == file_size
+        assert boundaries == sorted(boundaries)
+        # Interior boundaries must sit just after a newline
+        content = input_file.read_bytes()
+        for boundary in boundaries[1:-1]:
+            assert content[boundary - 1 : boundary] == b"\n"
+
+    def test_upper_parallel_matches_serial_output(self, tmp_path):
+        """Test that the parallel path produces the same output as serial."""
+        from repl_cli_template.core.processor import _upper_mmap, _upper_parallel
+
+        input_file = tmp_path / "test_input.txt"
+        input_file.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        serial_output = tmp_path / "serial.txt"
+        parallel_output = tmp_path / "parallel.txt"
+
+        serial_rows = _upper_mmap(input_file, serial_output)
+        parallel_rows = _upper_parallel(input_file, parallel_output, workers=2)
+
+        assert parallel_rows == serial_rows == 100
+        assert parallel_output.read_bytes() == serial_output.read_bytes()
+
     def test_process_data_file_not_found(self):
         """Test processing with non-existent file."""
         config = {}
@@ -69,6 +145,43 @@ logging:
         assert config["app"]["name"] == "Test App"
         assert config["logging"]["level"] == "DEBUG"
 
+        # load returns the config already merged with defaults
+        assert "paths" in config
+
+    def test_load_config_writes_and_uses_cache(self, tmp_path):
+        """Test that loading writes a sidecar cache and reuses it when fresh."""
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("app:\n  name: Cached App\n")
+
+        # First load parses YAML and writes the sidecar cache
+        config = ConfigManager.load(str(config_file))
+        assert config["app"]["name"] == "Cached App"
+
+        cache_file = tmp_path / "test_config.yaml.cache.pkl"
+        assert cache_file.exists()
+
+        # Second load should return the same data (served from cache)
+        config = ConfigManager.load(str(config_file))
+        assert config["app"]["name"] == "Cached App"
+
+    def test_load_config_cache_invalidated_on_change(self, tmp_path):
+        """Test that a modified YAML file is re-parsed, not served stale."""
+        import os
+
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("app:\n  name: Original\n")
+
+        config = ConfigManager.load(str(config_file))
+        assert config["app"]["name"] == "Original"
+
+        # Modify the file and bump mtime so the cache is stale
+        config_file.write_text("app:\n  name: Updated\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        config = ConfigManager.load(str(config_file))
+        assert config["app"]["name"] == "Updated"
+
     def test_load_nonexistent_config(self):
         """Test loading non-existent config file."""
         with pytest.raises(FileNotFoundError):
@@ -109,6 +222,38 @@ logging:
         assert config["logging"]["level"] == "DEBUG"
         assert config["logging"]["file"] == "test.log"
 
+    def test_flatten(self):
+        """Test flattening nested config into dot-notation keys."""
+        config = {"logging": {"level": "INFO", "file": "app.log"}, "debug": True}
+
+        flat = ConfigManager.flatten(config)
+
+        assert flat == {
+            "logging.level": "INFO",
+            "logging.file": "app.log",
+            "debug": True,
+        }
+
+    def test_get_after_set_sees_new_value(self):
+        """Test that set invalidates the cached flattened view."""
+        config = {"logging": {"level": "INFO"}}
+
+        # First get builds and caches the flattened view
+        assert ConfigManager.get(config, "logging.level") == "INFO"
+
+        ConfigManager.set(config, "logging.level", "DEBUG")
+
+        assert ConfigManager.get(config, "logging.level") == "DEBUG"
+
+    def test_get_with_throwaway_dicts_never_stale(self):
+        """Test that get on short-lived dicts never returns another dict's value.
+
+        Regression test: a global cache keyed on id(config) served stale
+        values when a freed dict's id was recycled.
+        """
+        for i in range(1000):
+            assert ConfigManager.get({"a": {"b": i}}, "a.b") == i
+
     def test_merge_with_defaults(self):
         """Test merging config with defaults."""
         custom_config = {
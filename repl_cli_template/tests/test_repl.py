@@ -127,6 +127,39 @@ class TestAutoCompletion:
             assert "/quit" in completions
             assert "/config" in completions
 
+    def test_slash_command_completer_matches_prefix(self):
+        """Test that SlashCommandCompleter yields only prefix matches."""
+        from prompt_toolkit.completion import CompleteEvent
+        from prompt_toolkit.document import Document
+
+        from repl_cli_template.ui.completion import SlashCommandCompleter
+
+        completer = SlashCommandCompleter(
+            {"help": "Show help", "config": "Config commands", "process": "Process data"}
+        )
+
+        document = Document("/c", cursor_position=2)
+        completions = list(completer.get_completions(document, CompleteEvent()))
+
+        assert [c.text for c in completions] == ["config"]
+        assert completions[0].display_meta_text == "Config commands"
+
+    def test_slash_command_completer_empty_prefix_lists_all(self):
+        """Test that a bare / lists every command in sorted order."""
+        from prompt_toolkit.completion import CompleteEvent
+        from prompt_toolkit.document import Document
+
+        from repl_cli_template.ui.completion import SlashCommandCompleter
+
+        completer = SlashCommandCompleter(
+            {"quit": "Quit", "help": "Show help", "config": "Config commands"}
+        )
+
+        document = Document("/", cursor_position=1)
+        completions = list(completer.get_completions(document, CompleteEvent()))
+
+        assert [c.text for c in completions] == ["config", "help", "quit"]
+
     def test_word_completer_creation(self):
         """Test that WordCompleter is created correctly."""
         from prompt_toolkit.completion import WordCompleter
@@ -139,10 +172,48 @@ class TestAutoCompletion:
         assert isinstance(completer, WordCompleter)
 
 
+class TestBoundedFileHistory:
+    """Tests for the bounded REPL history file."""
+
+    def test_trims_oversized_history_file(self, tmp_path):
+        """Test that a history file beyond max_lines is truncated to the tail."""
+        from repl_cli_template.ui.history import BoundedFileHistory
+
+        history_file = tmp_path / "history"
+        history_file.write_text("".join(f"+command {i}\n" for i in range(100)))
+
+        BoundedFileHistory(str(history_file), max_lines=10)
+
+        lines = history_file.read_text().splitlines()
+        assert len(lines) == 10
+        assert lines[-1] == "+command 99"
+
+    def test_leaves_small_history_file_untouched(self, tmp_path):
+        """Test that a history file within the limit is not rewritten."""
+        from repl_cli_template.ui.history import BoundedFileHistory
+
+        history_file = tmp_path / "history"
+        history_file.write_text("+command 1\n+command 2\n")
+
+        BoundedFileHistory(str(history_file), max_lines=10)
+
+        assert history_file.read_text() == "+command 1\n+command 2\n"
+
+    def test_handles_missing_history_file(self, tmp_path):
+        """Test that a missing history file doesn't raise."""
+        from repl_cli_template.ui.history import BoundedFileHistory
+
+        history_file = tmp_path / "history"
+
+        BoundedFileHistory(str(history_file), max_lines=10)
+
+        assert not history_file.exists()
+
+
 class TestREPLIntegration:
     """Integration tests for REPL functionality."""
 
-    @patch("repl_cli_template.app.repl")
+    @patch("click_repl.repl")
     @patch("repl_cli_template.app.show_welcome")
     def test_start_repl_shows_welcome(self, mock_welcome, mock_repl):
         """Test that start_repl displays welcome screen."""
@@ -173,7 +244,7 @@ class TestREPLIntegration:
                 # Verify welcome was called
                 mock_welcome.assert_called_once()
 
-    @patch("repl_cli_template.app.repl")
+    @patch("click_repl.repl")
     def test_start_repl_patches_execute_function(self, mock_repl):
         """Test that start_repl patches _execute_internal_and_sys_cmds."""
         import click_repl._repl as repl_module
@@ -206,7 +277,7 @@ class TestREPLIntegration:
             # Verify function was restored after start_repl exits
             assert repl_module._execute_internal_and_sys_cmds == original_func
 
-    @patch("repl_cli_template.app.repl")
+    @patch("click_repl.repl")
     def test_start_repl_restores_function_on_error(self, mock_repl):
         """Test that patched function is restored even if error occurs."""
         import click_repl._repl as repl_module
@@ -270,7 +341,7 @@ class TestREPLCommandExecution:
 class TestREPLErrorHandling:
     """Tests for error handling in REPL."""
 
-    @patch("repl_cli_template.app.repl")
+    @patch("click_repl.repl")
     @patch(
         "repl_cli_template.ui.welcome.show_goodbye"
     )  # Patch where it's defined, not where it's imported
@@ -301,7 +372,7 @@ class TestREPLErrorHandling:
                 # Verify goodbye was called
                 mock_goodbye.assert_called_once()
 
-    @patch("repl_cli_template.app.repl")
+    @patch("click_repl.repl")
     @patch("repl_cli_template.ui.welcome.show_goodbye")  # Patch where it's defined
     def test_eof_error_shows_goodbye(self, mock_goodbye, mock_repl):
         """Test that Ctrl+D (EOFError) shows goodbye message."""
@@ -2,6 +2,8 @@
 Custom auto-completion for REPL (Claude Code style).
 """
 
+import bisect
+
 from prompt_toolkit.completion import Completer, Completion, CompleteEvent
 from prompt_toolkit.document import Document
 from typing import Iterable, Optional, Any
@@ -31,6 +33,23 @@ class SlashCommandCompleter(Completer):
         self.commands = commands
         self.cli_group = cli_group
 
+        # Precomputed index of (name_lower, name, help) sorted by lowercase
+        # name, so per-keystroke completion avoids re-sorting and re-lowering
+        self._entries = sorted(
+            ((name.lower(), name, help_text or "") for name, help_text in commands.items()),
+            key=lambda entry: entry[0],
+        )
+        # Parallel key list for bisecting into the prefix range
+        self._keys = [entry[0] for entry in self._entries]
+
+        # Sorted subcommand lists per group command, computed once here
+        # instead of on every keystroke
+        self._subcommands: dict = {}
+        if cli_group is not None and hasattr(cli_group, "commands"):
+            for name, cmd in cli_group.commands.items():
+                if hasattr(cmd, "commands"):
+                    self._subcommands[name] = sorted(cmd.commands.items())
+
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> Iterable[Completion]:
@@ -83,7 +102,7 @@ class SlashCommandCompleter(Completer):
                         # Show subcommands
                         subcommand_lower = current_part.lower()
 
-                        for subcmd_name, subcmd in sorted(base_cmd.commands.items()):
+                        for subcmd_name, subcmd in self._subcommands.get(base_command, []):
                             if subcmd_name.lower().startswith(subcommand_lower):
                                 start_position = (
                                     -len(current_part) if current_part else 0
@@ -160,16 +179,24 @@ class SlashCommandCompleter(Completer):
         # Convert to lowercase for case-insensitive matching
         search_lower = search_text.lower()
 
-        # Find matching commands
-        for cmd_name, cmd_help in sorted(self.commands.items()):
-            if cmd_name.lower().startswith(search_lower):
-                # Calculate how many characters to replace
-                # If user typed "/c", we want to replace "c" with "config"
-                start_position = -len(search_text) if search_text else 0
-
-                yield Completion(
-                    text=cmd_name,
-                    start_position=start_position,
-                    display=f"/{cmd_name}",
-                    display_meta=cmd_help or "",
-                )
+        # Calculate how many characters to replace
+        # If user typed "/c", we want to replace "c" with "config"
+        start_position = -len(search_text) if search_text else 0
+
+        # Locate the prefix range in the sorted index with bisect: entries
+        # matching the prefix sit between search_lower and the next string
+        # after the prefix (last character bumped by one code point)
+        lo = bisect.bisect_left(self._keys, search_lower)
+        if search_lower:
+            next_prefix = search_lower[:-1] + chr(ord(search_lower[-1]) + 1)
+            hi = bisect.bisect_left(self._keys, next_prefix, lo)
+        else:
+            hi = len(self._keys)
+
+        for name_lower, cmd_name, cmd_help in self._entries[lo:hi]:
+            yield Completion(
+                text=cmd_name,
+                start_position=start_position,
+                display=f"/{cmd_name}",
+                display_meta=cmd_help,
+            )
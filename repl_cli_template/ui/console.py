@@ -0,0 +1,11 @@
+"""
+Shared Rich console for the application.
+"""
+
+from rich.console import Console
+
+from repl_cli_template.ui.styles import APP_THEME
+
+# Single application-wide console: one set of terminal probes and one
+# output lock, shared by the app entry point and every command module
+console = Console(theme=APP_THEME)
@@ -0,0 +1,77 @@
+"""
+Bounded prompt history for the REPL.
+"""
+
+import logging
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+
+from prompt_toolkit.history import FileHistory
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of lines kept in the history file
+DEFAULT_MAX_LINES = 5000
+
+
+class BoundedFileHistory(FileHistory):
+    """
+    FileHistory that trims the history file to its most recent entries.
+
+    Unbounded history files make prompt startup and history search slower
+    the longer the REPL is used, so the file is truncated to the last
+    `max_lines` lines before prompt_toolkit loads it. Trimming is
+    best-effort: any failure leaves the file as-is.
+    """
+
+    def __init__(self, filename: str, max_lines: int = DEFAULT_MAX_LINES):
+        """
+        Initialize bounded history, trimming the backing file if needed.
+
+        Args:
+            filename: Path to the history file
+            max_lines: Maximum number of lines to keep
+        """
+        self.max_lines = max_lines
+        self._trim(filename, max_lines)
+        super().__init__(filename)
+
+    @staticmethod
+    def _trim(filename: str, max_lines: int) -> None:
+        """
+        Atomically rewrite the history file keeping only the last lines.
+
+        Args:
+            filename: Path to the history file
+            max_lines: Maximum number of lines to keep
+        """
+        path = Path(filename)
+
+        try:
+            with open(path, "rb") as f:
+                total_lines = sum(1 for _ in f)
+
+            if total_lines <= max_lines:
+                return
+
+            with open(path, "rb") as f:
+                tail = deque(f, maxlen=max_lines)
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.writelines(tail)
+                os.replace(temp_path, path)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+
+            logger.debug(f"Trimmed history file to {max_lines} lines: {filename}")
+
+        except OSError:
+            # Missing or unwritable history file - nothing to trim
+            logger.debug(f"Could not trim history file: {filename}")